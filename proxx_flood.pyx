@@ -0,0 +1,53 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, initializedcheck=False
+"""
+Compiled version of proxx_game._flood
+
+It is optional: proxx_game uses it when the extension is built and falls back to its own _flood otherwise.
+Build it in place next to proxx_game.py with:
+
+    cythonize -i proxx_flood.pyx
+
+Arguments and result are the same as in proxx_game._flood.
+"""
+
+
+def flood(
+    const unsigned char[::1] is_hole,
+    const unsigned char[::1] holes_around,
+    unsigned char[::1] is_opened,
+    int[::1] queue,
+    Py_ssize_t first,
+    Py_ssize_t stride,
+) -> int:
+    cdef Py_ssize_t head = 0
+    cdef Py_ssize_t tail = 1
+    cdef Py_ssize_t idx, n, i
+    # Flat offsets of the adjacent cells, row-major order as in proxx_game._flood.
+    # The board has the border of opened holes, so there are no bounds checks.
+    # Loop over them has constant trip count, so C compiler is free to unroll it.
+    cdef Py_ssize_t offsets[8]
+    offsets[:] = [-stride - 1, -stride, -stride + 1, -1, 1, stride - 1, stride, stride + 1]
+
+    if is_opened[first]:
+        return 0
+
+    queue[0] = <int>first
+    is_opened[first] = 1
+
+    while head < tail:
+        idx = queue[head]
+        head += 1
+
+        if holes_around[idx]:
+            continue
+
+        for i in range(8):
+            n = idx + offsets[i]
+            if is_hole[n] or is_opened[n]:
+                continue
+            is_opened[n] = 1
+            queue[tail] = <int>n
+            tail += 1
+
+    # every queued cell is a newly opened one
+    return tail
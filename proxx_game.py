@@ -1,8 +1,48 @@
-from typing import List, NamedTuple
-import random
+from __future__ import annotations
+
+from typing import List, NamedTuple, Union
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from array import array
 from enum import Enum
-from collections import deque
 import os
+import platform
+import random
+import sys
+
+# Numpy (and numba) based classes are used by default on CPython.
+# Plain python classes (PurePythonBoard etc.) do not need anything but standard library,
+# so the game can be run with PyPy, whose JIT does well on such code: pypy3 proxx_game.py
+# Set PROXX_NUMPY=1 or PROXX_NUMPY=0 to choose explicitly, any other value is an error.
+_numpy_flag = os.environ.get("PROXX_NUMPY", "1" if platform.python_implementation() == "CPython" else "0")
+if _numpy_flag not in ("0", "1"):
+    raise ValueError(f"PROXX_NUMPY must be 0 or 1, got {_numpy_flag!r}")
+USE_NUMPY = _numpy_flag == "1"
+
+if USE_NUMPY:
+    import numpy as np
+
+    try:
+        from numba import njit
+    except ImportError:
+        njit = None
+else:
+    np = None
+    njit = None
+
+if njit is None:
+    # numba is optional: without it the compiled functions just run as plain python
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+
+def _require_numpy(name: str):
+    # Numpy based classes are defined either way, fail early with a hint instead of AttributeError on np
+    if not USE_NUMPY:
+        raise RuntimeError(
+            f"{name} needs numpy, which is disabled with PROXX_NUMPY=0: "
+            f"use PurePythonBoard, PurePythonHolesGenerator and PurePythonDisplayBoard instead"
+        )
 
 
 class GameStatus(Enum):
@@ -23,47 +63,32 @@ class Coord(NamedTuple):
     y: int
 
 
-# Let's keep everything about cell in single class for the sake of simplicity.
-# The only property that can be added in future is a flag attribute to mark cell as plausible black hole.
-# Since it is pretty simple class it could be rewritten as dataclass
+# The board itself keeps cells as parallel arrays (see Board), this class is just a read-only snapshot
+# of a single cell for the code that prefers to deal with cells one by one (like DisplayBoard).
+# Slots keep every instance small and without __dict__.
+@dataclass(slots=True)
 class Cell:
-    def __init__(self, is_hole: bool = False):
-        self.is_hole = is_hole
-        self.holes_around = 0
-        self.is_opened = False
+    is_hole: bool = False
+    holes_around: int = 0
+    is_opened: bool = False
 
 
 # This class contains the logic of randomization.
 # In the production code this separation will allow to mock this class to return pre-defined set of black holes.
 # Writing tests for board would be much easier in this way
-class HolesGenerator:
+# The way to pick random cells is left to subclasses: HolesGenerator and PurePythonHolesGenerator
+class BaseHolesGenerator(ABC):
+    __slots__ = ("width", "height", "holes_num")
+
     def __init__(self, size: int, holes_num: int):
         self.width = size
         self.height = size
         self.holes_num = holes_num
 
-    def generate_holes(self, skip_cell: Coord) -> List[Coord]:
-        # In order to get some random coordinates of the holes excluding first cell
-        # This approach allows to use sample method from random library.
-        # Otherwise we have to generate random coordinates and check if it is already generated.
-        # When number of black holes is near the size of the board it would take a lot of time.
-        # Let's hope that random.sample generates uniform distribution of values.
-        available_places = []
-        for x in range(self.width):
-            for y in range(self.height):
-                coord = Coord(x=x, y=y)
-                if coord == skip_cell:
-                    continue
-                available_places.append(coord)
-
-        holes_coords = list(
-            random.sample(
-                available_places,
-                k=self.holes_num,
-            )
-        )
-
-        return holes_coords
+    @abstractmethod
+    def generate_holes(self, skip_cell: Coord) -> Union[np.ndarray, List[int]]:
+        # Flat indices (x + y * width) of the holes, skip_cell is never a hole
+        ...
 
     def board_size(self) -> int:
         return self.width * self.height
@@ -72,15 +97,152 @@ class HolesGenerator:
         return coord.x + coord.y * self.width
 
     def _from_flat_coord(self, coord: int) -> Coord:
-        y, x = divmod(coord, self.height)
+        y, x = divmod(coord, self.width)
         return Coord(x=x, y=y)
 
 
+class HolesGenerator(BaseHolesGenerator):
+    __slots__ = ("rng",)
+
+    def __init__(self, size: int, holes_num: int):
+        super().__init__(size, holes_num)
+        _require_numpy("HolesGenerator")
+        self.rng = np.random.default_rng()
+
+    def generate_holes(self, skip_cell: Coord) -> np.ndarray:
+        # In order to get some random coordinates of the holes excluding first cell
+        # sample flat indices of all the cells but the last one and shift those that are not before the first cell.
+        # Otherwise we have to generate random coordinates and check if it is already generated.
+        # When number of black holes is near the size of the board it would take a lot of time.
+        # Holes are returned as flat indices (x + y * width) so the board can set them all at once.
+        flat_skip = self._to_flat_coord(skip_cell)
+        holes = self.rng.choice(self.board_size() - 1, size=self.holes_num, replace=False)
+        holes[holes >= flat_skip] += 1
+
+        return holes
+
+
+# The same generator for PurePythonBoard, random library is used instead of numpy
+class PurePythonHolesGenerator(BaseHolesGenerator):
+    __slots__ = ()
+
+    def generate_holes(self, skip_cell: Coord) -> List[int]:
+        # See HolesGenerator.generate_holes, random.sample does not build the list of all the cells from range
+        flat_skip = self._to_flat_coord(skip_cell)
+        holes = random.sample(range(self.board_size() - 1), k=self.holes_num)
+
+        return [hole if hole < flat_skip else hole + 1 for hole in holes]
+
+
+def _padded_matrix(width: int, height: int, border: int, inside: int) -> bytearray:
+    # Flat matrix of the board surrounded with one cell border (see Board), row after row
+    edge_row = bytes([border]) * (width + 2)
+    row = bytes([border]) + bytes([inside]) * width + bytes([border])
+    return bytearray(edge_row + row * height + edge_row)
+
+
+@njit(cache=True)
+def _flood(is_hole, holes_around, is_opened, queue, first, stride) -> int:
+    """
+    This is good old BFS:
+    1. add element to the queue
+    2. while queue is not empty, extract one element, check the adjacent and add them the queue if required
+
+    It is possible to archive the same result with recursion. But on large boards we can reach the recursion limit.
+
+    Arrays are flat (row after row) and cells are addressed by flat index y * stride + x,
+    so the adjacent cells are just fixed offsets from the current one.
+    The board is surrounded by the border of cells that are both holes and opened (see Board),
+    so every board cell has all 8 neighbors and no bounds checks are needed: the border is never queued.
+    Cells are marked as opened as soon as they are added to the queue, so every cell gets there at most once
+    and the array of the board size is enough for the queue. The caller owns the queue array so it is allocated
+    once per board rather than once per click.
+    Returns number of newly opened cells.
+    """
+    if is_opened[first]:
+        return 0
+
+    queue[0] = first
+    head = 0
+    tail = 1
+    is_opened[first] = 1
+
+    while head < tail:
+        idx = queue[head]
+        head += 1
+
+        if holes_around[idx]:
+            continue
+
+        # 8 adjacent cells are checked one by one rather than in the loop over relative coordinates.
+        # The order is row-major (row above, same row, row below) so queued indices go in ascending order
+        # and the queue is processed mostly sequentially in memory, which keeps arrays access cache friendly.
+        n = idx - stride - 1
+        if not is_hole[n] and not is_opened[n]:
+            is_opened[n] = 1
+            queue[tail] = n
+            tail += 1
+        n = idx - stride
+        if not is_hole[n] and not is_opened[n]:
+            is_opened[n] = 1
+            queue[tail] = n
+            tail += 1
+        n = idx - stride + 1
+        if not is_hole[n] and not is_opened[n]:
+            is_opened[n] = 1
+            queue[tail] = n
+            tail += 1
+        n = idx - 1
+        if not is_hole[n] and not is_opened[n]:
+            is_opened[n] = 1
+            queue[tail] = n
+            tail += 1
+        n = idx + 1
+        if not is_hole[n] and not is_opened[n]:
+            is_opened[n] = 1
+            queue[tail] = n
+            tail += 1
+        n = idx + stride - 1
+        if not is_hole[n] and not is_opened[n]:
+            is_opened[n] = 1
+            queue[tail] = n
+            tail += 1
+        n = idx + stride
+        if not is_hole[n] and not is_opened[n]:
+            is_opened[n] = 1
+            queue[tail] = n
+            tail += 1
+        n = idx + stride + 1
+        if not is_hole[n] and not is_opened[n]:
+            is_opened[n] = 1
+            queue[tail] = n
+            tail += 1
+
+    # every queued cell is a newly opened one
+    return tail
+
+
+try:
+    # Cython version of the same function, see proxx_flood.pyx. It's used only if it has been built.
+    from proxx_flood import flood as _flood
+except ImportError:
+    pass
+
+
 class Board:
-    # Pre-calculated relative coordinates of the adjacent cells
-    neighbors = [Coord(x=x, y=y) for x in range(-1, 2) for y in range(-1, 2) if not (x == 0 and y == 0)]
+    __slots__ = (
+        "width",
+        "height",
+        "_stride",
+        "status",
+        "cells_to_open",
+        "is_hole",
+        "holes_around",
+        "is_opened",
+        "_queue",
+    )
 
-    def __init__(self, size: int, holes_num: int, holes_generator: HolesGenerator, first_coord: Coord):
+    def __init__(self, size: int, holes_num: int, holes_generator: BaseHolesGenerator, first_coord: Coord):
         if size <= SMALLEST_BOARD_SIZE:
             raise ValueError(
                 f"Size {size} is too small. Board must be larger than {SMALLEST_BOARD_SIZE} otherwise it may not have any "
@@ -93,6 +255,8 @@ class Board:
         # The board is square but it is more natural to check appropriate side rather than abstract size
         self.width = size
         self.height = size
+        # length of the row of matrices below, including the border
+        self._stride = self.width + 2
 
         self.status = GameStatus.IN_GAME
 
@@ -102,67 +266,76 @@ class Board:
         """
         PART 1
 
-        Size of the board is known and it is tiny so simple structure like list of rows is fine.
-        It allows to keep everything in single matrix
-        In case of huge board it it possible to keep data in bit matrix or use dict to associate coordinates with values
-        Like Dict[(x, y)] = Cell
-        It allows to minimize memory usage for sparse data.
-        Hint: Numpy also can be used to keep matrix.
+        Every property of the cell is kept in its own numpy matrix (structure of arrays) instead of
+        the matrix of Cell objects: one byte per cell instead of the whole python object
+        and the whole board can be processed at once rather than cell by cell.
+        Matrices are indexed as [y, x] i.e. list of rows.
+
+        Matrices are one cell larger than the board on every side, the board itself is [1:-1, 1:-1].
+        Border cells are marked as both black holes and opened, so they are never opened by the flood fill
+        and it does not need to check if adjacent cell is on the board.
+        Internally cells are addressed by the flat index in these matrices, see click_on.
 
         Important Note:
         Why first_coord is required here?
         Original game does not allow to fail at the first step. So we have to generate the board AFTER the first step
         so that specified coordinates are of safe cell
         """
-        self.board: List[List[Cell]] = [[Cell() for _ in range(self.width)] for _ in range(self.height)]
+        self._allocate_cells()
         self._generate_board(holes_generator, first_coord)
         self.click_on(first_coord)
 
-    def _generate_board(self, holes_generator: HolesGenerator, first_coord: Coord):
+    def _allocate_cells(self):
+        _require_numpy("Board")
+        self.is_hole = np.ones((self.height + 2, self.width + 2), dtype=np.uint8)
+        self.is_hole[1:-1, 1:-1] = 0
+        self.holes_around = np.zeros((self.height + 2, self.width + 2), dtype=np.uint8)
+        self.is_opened = np.ones((self.height + 2, self.width + 2), dtype=np.uint8)
+        self.is_opened[1:-1, 1:-1] = 0
+        # flood fill queue of flat indices, see _flood
+        self._queue = np.empty(self.height * self.width, dtype=np.int32)
+
+    def _flat_cells(self) -> tuple:
+        # ravel() of the contiguous matrix is a flat view, so changes are made right in the matrices
+        return self.is_hole.ravel(), self.holes_around.ravel(), self.is_opened.ravel()
+
+    def _generate_board(self, holes_generator: BaseHolesGenerator, first_coord: Coord):
         self._generate_holes(holes_generator, first_coord)
         self._generate_holes_adjacent()
 
-    def _generate_holes(self, holes_generator: HolesGenerator, first_cell: Coord):
+    def _generate_holes(self, holes_generator: BaseHolesGenerator, first_cell: Coord):
         """
         PART 2
 
-        See HolesGenerator class for details
+        See BaseHolesGenerator class for details
         """
-        holes: List[Coord] = holes_generator.generate_holes(skip_cell=first_cell)
-        for hole_coord in holes:
-            hole_cell = self.at(hole_coord)
-            hole_cell.is_hole = True
+        holes: np.ndarray = holes_generator.generate_holes(skip_cell=first_cell)
+        ys, xs = np.divmod(holes, self.width)
+        self.is_hole[ys + 1, xs + 1] = 1
 
     def _generate_holes_adjacent(self):
         """
         PART 3
 
-        Go through all the cells and calc neighbor black holes
+        Calc neighbor black holes for all the cells at once.
+        The board is padded with empty cells (the border of is_hole is all holes, so it can't be used here)
+        so that every cell has all 8 neighbors. The sum over 3x3 square is split into the sum of 3 cells in every row
+        and then the sum of 3 such row sums, i.e. 4 additions of shifted matrices instead of 7.
+        The square includes the cell itself, but it does not matter: the cell is either empty or a black hole
+        which does not show the number anyway.
+        On huge boards this is limited by memory bandwidth, so the sums are accumulated in place
+        to avoid temporary matrices. The result is written right into the board part of holes_around.
         """
-        for y in range(self.height):
-            for x in range(self.width):
-                coord = Coord(x=x, y=y)
-                cell = self.at(coord)
-                if cell.is_hole:
-                    continue
-                cell.holes_around = sum(int(adjacent_cell.is_hole) for adjacent_cell in self._get_adjacent_cells(coord))
-
-    def _get_adjacent_coords(self, coord: Coord) -> List[Coord]:
-        adjacent_coords = []
-        for neighbor in self.neighbors:
-            adjacent_coord = Coord(x=neighbor.x + coord.x, y=neighbor.y + coord.y)
-            if (
-                adjacent_coord.x < 0
-                or adjacent_coord.x >= self.width
-                or adjacent_coord.y < 0
-                or adjacent_coord.y >= self.height
-            ):
-                continue
-            adjacent_coords.append(adjacent_coord)
-        return adjacent_coords
+        is_hole = self.is_hole[1:-1, 1:-1]
+        p = np.pad(is_hole, 1)
+        row_sums = p[:, :-2] + p[:, 1:-1]
+        row_sums += p[:, 2:]
 
-    def _get_adjacent_cells(self, coord: Coord) -> List[Cell]:
-        return [self.at(adjacent_coord) for adjacent_coord in self._get_adjacent_coords(coord)]
+        holes_around = self.holes_around[1:-1, 1:-1]
+        np.add(row_sums[:-2], row_sums[1:-1], out=holes_around)
+        holes_around += row_sums[2:]
+        # black holes don't show the number
+        holes_around *= is_hole ^ 1
 
     def click_on(self, coord: Coord):
         """
@@ -171,52 +344,95 @@ class Board:
         If we click on black hole then game is over
         Otherwise open the cell and check adjacent in case the cell is empty.
         If all cells are opened except black holes then the game is over.
-        """
-        cell = self.at(coord)
 
-        if cell.is_hole:
+        Coord is converted to the flat index once here, everything below works with flat indices only.
+        """
+        self._click_flat(self._flat_index(coord))
+
+    def _flat_index(self, coord: Coord) -> int:
+        # Coordinates must be checked here: because of the border outside cells either are the border
+        # (which is a black hole) or wrap around to some other cell of the board
+        if not (0 <= coord.x < self.width and 0 <= coord.y < self.height):
+            raise ValueError(f"{coord} is out of the board of the size {self.width}x{self.height}")
+        return coord.x + 1 + (coord.y + 1) * self._stride
+
+    def _click_flat(self, idx: int):
+        is_hole, _, _ = self._flat_cells()
+        if is_hole[idx]:
             self.status = GameStatus.LOST
             return
 
-        self._open_cells(coord)
+        self._open_flat(idx)
 
-    def _open_cells(self, coord: Coord):
+    def _open_flat(self, idx: int):
         """
-        This is good old DFS:
-        1. add element to the queue
-        2. while queue is not empty, extract one element, check the adjacent and add them the queue if required
-
-        It is possible to archive the same result with recursion. But on large boards we can reach the recursion limit.
+        The flood fill itself is done by _flood function, here we just keep the game state up to date.
         """
-        queue = deque([coord])
+        is_hole, holes_around, is_opened = self._flat_cells()
+        self.cells_to_open -= _flood(is_hole, holes_around, is_opened, self._queue, idx, self._stride)
+        if not self.cells_to_open:
+            self.status = GameStatus.WIN
 
-        while queue:
-            coord = queue.popleft()
-            cell = self.at(coord)
-            self._open_cell(cell)
+    def at(self, coord: Coord) -> Cell:
+        # Not used by the game logic itself, it's just a convenient view of the single cell
+        idx = self._flat_index(coord)
+        is_hole, holes_around, is_opened = self._flat_cells()
+        return Cell(
+            is_hole=bool(is_hole[idx]),
+            holes_around=int(holes_around[idx]),
+            is_opened=bool(is_opened[idx]),
+        )
 
-            if cell.holes_around:
-                continue
 
-            for adjacent_coord in self._get_adjacent_coords(coord):
-                adjacent_cell = self.at(adjacent_coord)
-                if adjacent_cell.is_hole:
-                    continue
-                if adjacent_cell.is_opened:
-                    continue
-                queue.append(adjacent_coord)
+class PurePythonBoard(Board):
+    """
+    The same board without numpy: matrices are flat bytearrays (row after row, with the same border around the board)
+    and everything that Board does with the whole matrices is done cell by cell.
+    It's slow on CPython, but it is what PyPy JIT is good at.
+    """
 
-    def _open_cell(self, cell: Cell):
-        if cell.is_opened:
-            return
+    __slots__ = ()
 
-        cell.is_opened = True
-        self.cells_to_open -= 1
-        if not self.cells_to_open:
-            self.status = GameStatus.WIN
+    def _allocate_cells(self):
+        self.is_hole = _padded_matrix(self.width, self.height, border=1, inside=0)
+        self.holes_around = _padded_matrix(self.width, self.height, border=0, inside=0)
+        self.is_opened = _padded_matrix(self.width, self.height, border=1, inside=0)
+        self._queue = array("i", [0]) * (self.width * self.height)
 
-    def at(self, coord: Coord) -> Cell:
-        return self.board[coord.y][coord.x]
+    def _flat_cells(self) -> tuple:
+        return self.is_hole, self.holes_around, self.is_opened
+
+    def row_indices(self) -> List[range]:
+        # Indices of the board cells in the flat matrices, row by row, the border is skipped
+        stride = self._stride
+        return [range(y * stride + 1, y * stride + self.width + 1) for y in range(1, self.height + 1)]
+
+    def _generate_holes(self, holes_generator: BaseHolesGenerator, first_cell: Coord):
+        is_hole = self.is_hole
+        width = self.width
+        stride = self._stride
+        for hole in holes_generator.generate_holes(skip_cell=first_cell):
+            y, x = divmod(hole, width)
+            is_hole[(y + 1) * stride + x + 1] = 1
+
+    def _generate_holes_adjacent(self):
+        # See Board._generate_holes_adjacent: the border of is_hole is all holes,
+        # so holes are counted on the copy of it with the empty border instead
+        is_hole = self.is_hole
+        holes_around = self.holes_around
+        stride = self._stride
+        holes = bytearray(is_hole)
+        holes[:stride] = bytes(stride)
+        holes[-stride:] = bytes(stride)
+        holes[::stride] = bytes(self.height + 2)
+        holes[stride - 1 :: stride] = bytes(self.height + 2)
+
+        neighbor_offsets = (-stride - 1, -stride, -stride + 1, -1, 1, stride - 1, stride, stride + 1)
+        for y in range(1, self.height + 1):
+            for idx in range(y * stride + 1, y * stride + self.width + 1):
+                if is_hole[idx]:
+                    continue
+                holes_around[idx] = sum(1 for offset in neighbor_offsets if holes[idx + offset])
 
 
 class DisplayBoard:
@@ -229,32 +445,62 @@ class DisplayBoard:
         self.board = board
 
     def show_raw_board(self):
-        print("  ", " ".join([str(x) for x in range(self.board.width)]))
-        print(" ", "-" * self.board.width * 2)
-        for y, row in enumerate(self.board.board):
-            print(f"{y}|", " ".join([self._raw_cell(cell) for cell in row]))
-
-    def _raw_cell(self, cell: Cell):
-        if cell.is_hole:
-            return "H"
-        if cell.holes_around:
-            return str(cell.holes_around)
-        return "."
+        self._show(self._raw_cells())
+
+    def _raw_cells(self) -> List[List[str]]:
+        return self._raw_matrix().tolist()
+
+    def _raw_matrix(self) -> np.ndarray:
+        # Matrix of cell symbols is built for the whole board at once rather than cell by cell.
+        # Board matrices have the border around the board, see Board.
+        _require_numpy("DisplayBoard")
+        holes_around = self.board.holes_around[1:-1, 1:-1]
+        numbers = np.where(holes_around > 0, holes_around.astype(str), ".")
+        return np.where(self.board.is_hole[1:-1, 1:-1] > 0, "H", numbers)
 
     def show_game_board(self):
-        print("  ", " ".join([str(x) for x in range(self.board.width)]))
-        print(" ", "-" * self.board.width * 2)
-        for y, row in enumerate(self.board.board):
-            print(f"{y}|", " ".join([self._game_cell(cell) for cell in row]))
+        self._show(self._game_cells())
 
-    def _game_cell(self, cell: Cell):
-        if not cell.is_opened:
-            return "*"
-        if cell.is_hole:
-            return "H"
-        if cell.holes_around:
-            return str(cell.holes_around)
-        return "."
+    def _game_cells(self) -> List[List[str]]:
+        raw = self._raw_matrix()
+        return np.where(self.board.is_opened[1:-1, 1:-1] > 0, raw, "*").tolist()
+
+    def _show(self, cells: List[List[str]]):
+        lines = [
+            " ".join(["  "] + [str(x) for x in range(self.board.width)]),
+            " ".join([" ", "-" * self.board.width * 2]),
+        ]
+        lines.extend(f"{y}| " + " ".join(row) for y, row in enumerate(cells))
+        print("\n".join(lines))
+
+
+class PurePythonDisplayBoard(DisplayBoard):
+    """
+    DisplayBoard for PurePythonBoard, symbols are taken cell by cell
+    """
+
+    def _raw_cells(self) -> List[List[str]]:
+        return self._cells(hide_closed=False)
+
+    def _game_cells(self) -> List[List[str]]:
+        return self._cells(hide_closed=True)
+
+    def _cells(self, hide_closed: bool) -> List[List[str]]:
+        board = self.board
+        rows = []
+        for indices in board.row_indices():
+            row = []
+            for idx in indices:
+                if hide_closed and not board.is_opened[idx]:
+                    row.append("*")
+                elif board.is_hole[idx]:
+                    row.append("H")
+                elif board.holes_around[idx]:
+                    row.append(str(board.holes_around[idx]))
+                else:
+                    row.append(".")
+            rows.append(row)
+        return rows
 
 
 def get_coord_to_open(size: int) -> Coord:
@@ -268,8 +514,10 @@ def get_coord_to_open(size: int) -> Coord:
             y = int(raw_y)
             if x < 0 or x >= size:
                 print("x is incorrect")
+                continue
             if y < 0 or y >= size:
                 print("y is incorrect")
+                continue
             print()
             return Coord(x=x, y=y)
         except Exception as ex:
@@ -281,21 +529,33 @@ def main():
     This is how game flow might look like with interface
     """
 
-    os.system("clear")
+    # clear the screen with ANSI escape codes rather than running external clear command
+    sys.stdout.write("\x1b[2J\x1b[H")
+    sys.stdout.flush()
 
     size = 8
     holes_num = 5
 
+    # see USE_NUMPY
+    if USE_NUMPY:
+        board_class, holes_generator_class, display_class = Board, HolesGenerator, DisplayBoard
+    else:
+        board_class, holes_generator_class, display_class = (
+            PurePythonBoard,
+            PurePythonHolesGenerator,
+            PurePythonDisplayBoard,
+        )
+
     first_coord = get_coord_to_open(size)
 
-    board = Board(
+    board = board_class(
         size=size,
         holes_num=holes_num,
-        holes_generator=HolesGenerator(size=size, holes_num=holes_num),
+        holes_generator=holes_generator_class(size=size, holes_num=holes_num),
         first_coord=first_coord,
     )
 
-    display = DisplayBoard(board)
+    display = display_class(board)
     print("Cheat board with all info exposed")
     display.show_raw_board()
     print("\n")